@@ -0,0 +1,16 @@
+"""
+Initial activities state shared by the Mergington High School API tests
+"""
+
+import json
+
+import app as app_module
+
+# Snapshot of the app's initial state, taken before any test runs.
+# Serialized once; json.loads rebuilds a fresh copy faster than deepcopy
+ORIGINAL_ACTIVITIES_JSON = json.dumps(app_module.activities)
+
+ORIGINAL_ACTIVITIES = json.loads(ORIGINAL_ACTIVITIES_JSON)
+
+# Participant count of each activity in the initial state
+INITIAL_COUNTS = {name: len(data["participants"]) for name, data in ORIGINAL_ACTIVITIES.items()}
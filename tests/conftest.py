@@ -0,0 +1,32 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import json
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+from app import app
+from tests.activity_data import ORIGINAL_ACTIVITIES_JSON
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the FastAPI app, shared across the session"""
+    # Entering the client runs the app's lifespan once for the whole session
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(request, monkeypatch):
+    """Give each test a fresh copy of the initial activities state"""
+    # Read-only tests never mutate anything, and every other test works on
+    # its own copy, so the original dict is still pristine for them
+    if request.node.get_closest_marker("readonly"):
+        return
+
+    # The endpoints look up the module-level name on every request, so
+    # rebinding it is enough; monkeypatch restores the original afterwards
+    monkeypatch.setattr(app_module, "activities", json.loads(ORIGINAL_ACTIVITIES_JSON))
@@ -3,94 +3,26 @@ Tests for the Mergington High School Activities API
 """
 
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
+from fastapi import HTTPException
 
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import app as app_module
+from app import signup_for_activity, unregister_from_activity
+from tests.activity_data import INITIAL_COUNTS, ORIGINAL_ACTIVITIES
 
-from app import app, activities
 
+def _participants(activity):
+    """Read an activity's participants from the in-memory store as a set"""
+    return set(app_module.activities[activity]["participants"])
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
 
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    original_activities = {
-        "Basketball Team": {
-            "description": "Competitive basketball team for intramural and varsity play",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Learn and practice tennis skills in a competitive setting",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["james@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Perform in school plays and develop acting skills",
-            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["grace@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Create paintings, sculptures, and mixed media artwork",
-            "schedule": "Saturdays, 10:00 AM - 12:00 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop argumentation and public speaking skills",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 14,
-            "participants": ["noah@mergington.edu"]
-        },
-        "Robotics Club": {
-            "description": "Build and program robots for competitions",
-            "schedule": "Mondays and Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["ava@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Clear and reset
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
+@pytest.fixture(scope="module")
+def activities_data(client):
+    """Fetch /activities once and share the payload across the module"""
+    return client.get("/activities").json()
 
 
+@pytest.mark.read
+@pytest.mark.readonly
 class TestGetActivities:
     """Test the GET /activities endpoint"""
     
@@ -103,131 +35,119 @@ class TestGetActivities:
         assert "Basketball Team" in data
         assert "Chess Club" in data
     
-    def test_get_activities_has_required_fields(self, client):
+    @pytest.mark.parametrize("activity", list(ORIGINAL_ACTIVITIES))
+    def test_get_activities_has_required_fields(self, activities_data, activity):
         """Test that each activity has required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        for activity_name, activity_data in data.items():
-            assert "description" in activity_data
-            assert "schedule" in activity_data
-            assert "max_participants" in activity_data
-            assert "participants" in activity_data
-            assert isinstance(activity_data["participants"], list)
+        activity_data = activities_data[activity]
+        assert "description" in activity_data
+        assert "schedule" in activity_data
+        assert "max_participants" in activity_data
+        assert "participants" in activity_data
+        assert isinstance(activity_data["participants"], list)
 
 
+@pytest.mark.write
 class TestSignup:
-    """Test the POST /activities/{activity_name}/signup endpoint"""
+    """Test the POST /activities/{activity_name}/signup handler directly"""
     
-    def test_signup_success(self, client):
+    def test_signup_success(self):
         """Test successful signup"""
-        response = client.post(
-            "/activities/Basketball Team/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 200
-        data = response.json()
+        data = signup_for_activity("Basketball Team", "test@mergington.edu")
         assert "Signed up test@mergington.edu" in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "test@mergington.edu" in activities_data["Basketball Team"]["participants"]
+        assert "test@mergington.edu" in _participants("Basketball Team")
     
-    def test_signup_duplicate_email(self, client):
+    def test_signup_duplicate_email(self):
         """Test signup fails if student already signed up"""
         # First signup succeeds
-        response1 = client.post(
-            "/activities/Basketball Team/signup?email=test@mergington.edu"
-        )
-        assert response1.status_code == 200
+        signup_for_activity("Basketball Team", "test@mergington.edu")
         
         # Second signup with same email fails
-        response2 = client.post(
-            "/activities/Basketball Team/signup?email=test@mergington.edu"
-        )
-        assert response2.status_code == 400
-        data = response2.json()
-        assert "already signed up" in data["detail"]
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity("Basketball Team", "test@mergington.edu")
+        assert exc_info.value.status_code == 400
+        assert "already signed up" in exc_info.value.detail
     
-    def test_signup_nonexistent_activity(self, client):
+    def test_signup_nonexistent_activity(self):
         """Test signup fails for non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent Activity/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"]
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity("Nonexistent Activity", "test@mergington.edu")
+        assert exc_info.value.status_code == 404
+        assert "not found" in exc_info.value.detail
     
-    def test_signup_multiple_students(self, client):
+    def test_signup_multiple_students(self):
         """Test multiple students can sign up for same activity"""
-        response1 = client.post(
-            "/activities/Tennis Club/signup?email=student1@mergington.edu"
-        )
-        response2 = client.post(
-            "/activities/Tennis Club/signup?email=student2@mergington.edu"
-        )
-        
-        assert response1.status_code == 200
-        assert response2.status_code == 200
+        signup_for_activity("Tennis Club", "student1@mergington.edu")
+        signup_for_activity("Tennis Club", "student2@mergington.edu")
         
-        activities_response = client.get("/activities")
-        participants = activities_response.json()["Tennis Club"]["participants"]
+        participants = _participants("Tennis Club")
         assert "student1@mergington.edu" in participants
         assert "student2@mergington.edu" in participants
 
 
+@pytest.mark.write
 class TestUnregister:
-    """Test the POST /activities/{activity_name}/unregister endpoint"""
+    """Test the POST /activities/{activity_name}/unregister handler directly"""
     
-    def test_unregister_success(self, client):
+    def test_unregister_success(self):
         """Test successful unregister"""
         # First, sign up
-        client.post("/activities/Basketball Team/signup?email=test@mergington.edu")
+        signup_for_activity("Basketball Team", "test@mergington.edu")
         
         # Then unregister
-        response = client.post(
-            "/activities/Basketball Team/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 200
-        data = response.json()
+        data = unregister_from_activity("Basketball Team", "test@mergington.edu")
         assert "Unregistered" in data["message"]
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        participants = activities_response.json()["Basketball Team"]["participants"]
-        assert "test@mergington.edu" not in participants
+        assert "test@mergington.edu" not in _participants("Basketball Team")
     
-    def test_unregister_nonexistent_activity(self, client):
+    def test_unregister_nonexistent_activity(self):
         """Test unregister fails for non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent Activity/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"]
+        with pytest.raises(HTTPException) as exc_info:
+            unregister_from_activity("Nonexistent Activity", "test@mergington.edu")
+        assert exc_info.value.status_code == 404
+        assert "not found" in exc_info.value.detail
     
-    def test_unregister_not_signed_up(self, client):
+    def test_unregister_not_signed_up(self):
         """Test unregister fails if student not signed up"""
+        with pytest.raises(HTTPException) as exc_info:
+            unregister_from_activity("Basketball Team", "notregistered@mergington.edu")
+        assert exc_info.value.status_code == 400
+        assert "not signed up" in exc_info.value.detail
+    
+    def test_unregister_existing_participant(self):
+        """Test unregistering an existing participant"""
+        unregister_from_activity("Basketball Team", "alex@mergington.edu")
+        
+        # Verify participant was removed
+        assert "alex@mergington.edu" not in _participants("Basketball Team")
+
+
+@pytest.mark.read
+@pytest.mark.readonly
+class TestWireFormat:
+    """Test that handler errors reach the client as JSON over HTTP"""
+    
+    def test_signup_nonexistent_activity(self, client):
+        """Test signup returns 404 with a detail message"""
         response = client.post(
-            "/activities/Basketball Team/unregister?email=notregistered@mergington.edu"
+            "/activities/Nonexistent Activity/signup?email=test@mergington.edu"
         )
-        assert response.status_code == 400
-        data = response.json()
-        assert "not signed up" in data["detail"]
+        assert response.status_code == 404
+        assert "not found" in response.json()["detail"]
     
-    def test_unregister_existing_participant(self, client):
-        """Test unregistering an existing participant"""
+    def test_unregister_nonexistent_activity(self, client):
+        """Test unregister returns 404 with a detail message"""
         response = client.post(
-            "/activities/Basketball Team/unregister?email=alex@mergington.edu"
+            "/activities/Nonexistent Activity/unregister?email=test@mergington.edu"
         )
-        assert response.status_code == 200
-        
-        # Verify participant was removed
-        activities_response = client.get("/activities")
-        participants = activities_response.json()["Basketball Team"]["participants"]
-        assert "alex@mergington.edu" not in participants
+        assert response.status_code == 404
+        assert "not found" in response.json()["detail"]
 
 
+@pytest.mark.read
+@pytest.mark.readonly
 class TestRoot:
     """Test the GET / endpoint"""
     
@@ -238,6 +158,7 @@ class TestRoot:
         assert "/static/index.html" in response.headers["location"]
 
 
+@pytest.mark.integration
 class TestIntegration:
     """Integration tests for multiple operations"""
     
@@ -246,9 +167,7 @@ class TestIntegration:
         email = "integration@mergington.edu"
         activity = "Drama Club"
         
-        # Get initial participant count
-        initial_response = client.get("/activities")
-        initial_count = len(initial_response.json()[activity]["participants"])
+        initial_count = INITIAL_COUNTS[activity]
         
         # Sign up
         signup_response = client.post(
@@ -257,9 +176,7 @@ class TestIntegration:
         assert signup_response.status_code == 200
         
         # Verify count increased
-        after_signup = client.get("/activities")
-        after_count = len(after_signup.json()[activity]["participants"])
-        assert after_count == initial_count + 1
+        assert len(app_module.activities[activity]["participants"]) == initial_count + 1
         
         # Unregister
         unregister_response = client.post(
@@ -268,6 +185,4 @@ class TestIntegration:
         assert unregister_response.status_code == 200
         
         # Verify count back to initial
-        after_unregister = client.get("/activities")
-        final_count = len(after_unregister.json()[activity]["participants"])
-        assert final_count == initial_count
+        assert len(app_module.activities[activity]["participants"]) == initial_count